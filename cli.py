@@ -3,17 +3,17 @@ Command-line interface for managing job applications
 """
 
 import argparse
+import logging
 import sys
 from datetime import datetime, timedelta
-from src.scraper import IndeedScraper, LinkedInScraper, GlassdoorScraper
-from src.applicator import ApplicationManager
-from src.reporter import ReportGenerator, print_status_summary
-from src.contact_finder import ContactFinder
-from src.database import SessionLocal, JobApplication, init_db
+
+__version__ = '1.0.0'
 
 
 def cmd_search(args):
     """Search for job postings"""
+    from src.scraper import IndeedScraper
+    
     print(f"\n📋 Searching for {args.keyword} jobs in {args.location}...")
     
     scraper = IndeedScraper()
@@ -39,10 +39,23 @@ def cmd_apply(args):
         print("Error: --company is required for applying")
         return False
     
+    from sqlalchemy.orm import load_only
+    from src.applicator import ApplicationManager
+    from src.database import SessionLocal, JobApplication
+    
     manager = ApplicationManager()
     
     db = SessionLocal()
-    job = db.query(JobApplication).filter_by(company_name=args.company).first()
+    job = db.query(JobApplication).options(
+        load_only(
+            JobApplication.job_id,
+            JobApplication.company_name,
+            JobApplication.job_title,
+            JobApplication.job_url,
+            JobApplication.location,
+            JobApplication.company_contact_email
+        )
+    ).filter_by(company_name=args.company).first()
     
     if not job:
         print(f"Error: No job found for {args.company}")
@@ -71,6 +84,8 @@ def cmd_apply(args):
 
 def cmd_report(args):
     """Generate reports"""
+    from src.reporter import ReportGenerator, print_status_summary
+    
     reporter = ReportGenerator()
     
     print("\n📊 Generating reports...\n")
@@ -95,13 +110,39 @@ def cmd_report(args):
 
 def cmd_status(args):
     """Show application status summary"""
+    from src.reporter import print_status_summary
+    
     print_status_summary()
 
 
 def cmd_track(args):
     """Track application status for a company"""
+    from sqlalchemy.orm import load_only
+    from src.database import SessionLocal, JobApplication
+    
     db = SessionLocal()
-    job = db.query(JobApplication).filter_by(company_name=args.company).first()
+    # Only the fields printed below; skips the description and feedback blobs
+    job = db.query(JobApplication).options(
+        load_only(
+            JobApplication.company_name,
+            JobApplication.job_title,
+            JobApplication.location,
+            JobApplication.job_board,
+            JobApplication.posted_date,
+            JobApplication.date_applied,
+            JobApplication.application_status,
+            JobApplication.application_method,
+            JobApplication.date_contacted,
+            JobApplication.response_type,
+            JobApplication.response_content,
+            JobApplication.interview_scheduled,
+            JobApplication.interview_date,
+            JobApplication.interview_time,
+            JobApplication.interview_type,
+            JobApplication.interview_location,
+            JobApplication.notes
+        )
+    ).filter_by(company_name=args.company).first()
     
     if not job:
         print(f"No application found for {args.company}")
@@ -138,6 +179,8 @@ def cmd_track(args):
 
 def cmd_contact(args):
     """Find company contact information"""
+    from src.contact_finder import ContactFinder
+    
     finder = ContactFinder()
     info = finder.find_company_info(args.company, args.website)
     
@@ -152,32 +195,29 @@ def cmd_contact(args):
 
 def cmd_init_db(args):
     """Initialize database"""
+    from src.database import init_db
+    
     print("Initializing database...")
     init_db()
     print("✓ Database initialized")
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description='Job Application Automation Tool'
-    )
-    
-    subparsers = parser.add_subparsers(dest='command', help='Commands')
-    
-    # Search command
+def _build_search(subparsers):
     search_parser = subparsers.add_parser('search', help='Search for jobs')
     search_parser.add_argument('keyword', help='Job keyword')
     search_parser.add_argument('--location', default='Île-de-France', help='Location')
     search_parser.add_argument('--pages', type=int, default=3, help='Number of pages')
     search_parser.set_defaults(func=cmd_search)
-    
-    # Apply command
+
+
+def _build_apply(subparsers):
     apply_parser = subparsers.add_parser('apply', help='Apply to a job')
     apply_parser.add_argument('--company', required=True, help='Company name')
     apply_parser.add_argument('--method', default='email', choices=['email', 'form', 'linkedin'])
     apply_parser.set_defaults(func=cmd_apply)
-    
-    # Report command
+
+
+def _build_report(subparsers):
     report_parser = subparsers.add_parser('report', help='Generate reports')
     report_parser.add_argument(
         '--type',
@@ -185,26 +225,68 @@ def main():
         choices=['all', 'applications', 'contacts', 'interviews', 'weekly', 'summary']
     )
     report_parser.set_defaults(func=cmd_report)
-    
-    # Status command
+
+
+def _build_status(subparsers):
     status_parser = subparsers.add_parser('status', help='Show status summary')
     status_parser.set_defaults(func=cmd_status)
-    
-    # Track command
+
+
+def _build_track(subparsers):
     track_parser = subparsers.add_parser('track', help='Track specific application')
     track_parser.add_argument('company', help='Company name')
     track_parser.set_defaults(func=cmd_track)
-    
-    # Contact command
+
+
+def _build_contact(subparsers):
     contact_parser = subparsers.add_parser('contact', help='Find contact information')
     contact_parser.add_argument('company', help='Company name')
     contact_parser.add_argument('--website', help='Company website')
     contact_parser.set_defaults(func=cmd_contact)
-    
-    # Init DB command
+
+
+def _build_init(subparsers):
     init_parser = subparsers.add_parser('init', help='Initialize database')
     init_parser.set_defaults(func=cmd_init_db)
+
+
+# Subcommand name -> parser builder, in the order shown by --help
+_SUBCOMMAND_BUILDERS = {
+    'search': _build_search,
+    'apply': _build_apply,
+    'report': _build_report,
+    'status': _build_status,
+    'track': _build_track,
+    'contact': _build_contact,
+    'init': _build_init,
+}
+
+
+def _build_parser(command=None):
+    """Build the argument parser, with only `command`'s subparser when it is known"""
+    parser = argparse.ArgumentParser(
+        description='Job Application Automation Tool'
+    )
+    parser.add_argument('--version', action='version', version=f'%(prog)s {__version__}')
+    
+    subparsers = parser.add_subparsers(dest='command', help='Commands')
+    
+    # Only build the requested subcommand; fall back to the full tree for
+    # --help, no arguments or unknown commands so usage stays complete
+    if command in _SUBCOMMAND_BUILDERS:
+        _SUBCOMMAND_BUILDERS[command](subparsers)
+    else:
+        for build in _SUBCOMMAND_BUILDERS.values():
+            build(subparsers)
+    
+    return parser
+
+
+def main():
+    # Scraper and reporter messages go through logging; show them like plain output
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
     
+    parser = _build_parser(sys.argv[1] if len(sys.argv) > 1 else None)
     args = parser.parse_args()
     
     if not args.command:
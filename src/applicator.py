@@ -1,20 +1,58 @@
+import os
 import smtplib
+from email.header import Header
+from email.mime.application import MIMEApplication
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import Dict, List
 import time
 from config.config import config
-from src.database import SessionLocal, JobApplication
+from sqlalchemy import select
+from src.database import SessionLocal, JobApplication, dialect_insert, supports_on_conflict
 from datetime import datetime
 
+# Columns an application overwrites on a job row that already exists
+_APPLIED_FIELDS = ('date_applied', 'application_method', 'application_status')
+
+_COVER_LETTER_TEMPLATE = """
+Dear Hiring Manager,
+
+I am writing to express my strong interest in the {job_title} position at {company_name}.
+
+With my relevant experience and skills, I am confident I can make a significant contribution to your team.
+
+Job Details:
+- Position: {job_title}
+- Company: {company_name}
+- Location: {location}
+
+I believe this role aligns perfectly with my career goals and expertise.
+
+Thank you for considering my application. I look forward to the opportunity to discuss how I can contribute to your organization.
+
+Best regards,
+[Your Name]
+Contact: [Your Email]
+Phone: [Your Phone]
+""".strip()
+
 class ApplicationManager:
     """Manages job applications"""
     
-    def __init__(self):
+    def __init__(self, flush_every: int = 10):
         self.db = SessionLocal()
         self.email_sender = config.EMAIL_ADDRESS
         self.email_password = config.EMAIL_PASSWORD
         self.applications_today = 0
+        
+        # Applications are buffered and written in one transaction per batch
+        self.flush_every = flush_every
+        self._pending: List[Dict] = []
+        
+        # SMTP connection is opened on first send and reused until close()
+        self._smtp = None
+        # Monotonic time before which the next email must not be sent
+        self._next_send_at = 0.0
     
     def apply_to_job(self, job_data: Dict, method: str = "email") -> bool:
         """
@@ -52,8 +90,11 @@ class ApplicationManager:
         """Apply to job via email"""
         try:
             company_email = job_data.get('company_contact_email')
+            company_name = job_data.get('company_name')
+            job_title = job_data.get('job_title')
+            
             if not company_email:
-                print(f"No contact email found for {job_data.get('company_name')}")
+                print(f"No contact email found for {company_name}")
                 return False
             
             # Generate cover letter
@@ -62,13 +103,12 @@ class ApplicationManager:
             # Send email
             self._send_email(
                 recipient=company_email,
-                subject=f"Application for {job_data.get('job_title')} Position",
+                subject=f"Application for {job_title} Position",
                 body=cover_letter,
                 attachments=['resume.pdf', 'cover_letter.pdf']
             )
             
-            print(f"✓ Applied to {job_data.get('company_name')} - {job_data.get('job_title')}")
-            time.sleep(config.APPLICATION_DELAY_SECONDS)
+            print(f"✓ Applied to {company_name} - {job_title}")
             return True
         
         except Exception as e:
@@ -100,79 +140,166 @@ class ApplicationManager:
     
     def _generate_cover_letter(self, job_data: Dict) -> str:
         """Generate personalized cover letter"""
-        template = f"""
-Dear Hiring Manager,
-
-I am writing to express my strong interest in the {job_data.get('job_title')} position at {job_data.get('company_name')}.
-
-With my relevant experience and skills, I am confident I can make a significant contribution to your team.
-
-Job Details:
-- Position: {job_data.get('job_title')}
-- Company: {job_data.get('company_name')}
-- Location: {job_data.get('location')}
-
-I believe this role aligns perfectly with my career goals and expertise.
-
-Thank you for considering my application. I look forward to the opportunity to discuss how I can contribute to your organization.
-
-Best regards,
-[Your Name]
-Contact: [Your Email]
-Phone: [Your Phone]
-        """
-        return template.strip()
+        return _COVER_LETTER_TEMPLATE.format(
+            job_title=job_data.get('job_title') or '',
+            company_name=job_data.get('company_name') or '',
+            location=job_data.get('location') or ''
+        )
     
     def _send_email(self, recipient: str, subject: str, body: str, attachments: List[str] = None):
         """Send email with optional attachments"""
         try:
-            message = MIMEMultipart()
-            message['From'] = self.email_sender
-            message['To'] = recipient
-            message['Subject'] = subject
+            files = []
+            for path in attachments or []:
+                if os.path.isfile(path):
+                    files.append(path)
+                else:
+                    print(f"Attachment not found, skipping: {path}")
             
-            message.attach(MIMEText(body, 'plain'))
+            # A multipart envelope is only needed when there is something to attach
+            if files:
+                message = MIMEMultipart()
+                message.attach(MIMEText(body, 'plain', 'utf-8'))
+                
+                for path in files:
+                    with open(path, 'rb') as f:
+                        part = MIMEApplication(f.read(), name=os.path.basename(path))
+                    part.add_header('Content-Disposition', 'attachment', filename=os.path.basename(path))
+                    message.attach(part)
+            else:
+                message = MIMEText(body, 'plain', 'utf-8')
             
-            # Note: Add attachment handling if needed
+            message['From'] = self.email_sender
+            message['To'] = recipient
+            message['Subject'] = Header(subject, 'utf-8')
             
-            # Connect to Gmail SMTP
-            with smtplib.SMTP_SSL('smtp.gmail.com', 465) as server:
-                server.login(self.email_sender, self.email_password)
-                server.send_message(message)
+            self._wait_for_send_slot()
+            try:
+                self._get_smtp().send_message(message)
+            except smtplib.SMTPServerDisconnected:
+                # Server dropped the idle connection; reconnect once and retry
+                self._smtp = None
+                self._get_smtp().send_message(message)
+            self._next_send_at = time.monotonic() + config.APPLICATION_DELAY_SECONDS
             
             print(f"Email sent to {recipient}")
         
         except Exception as e:
             print(f"Error sending email: {e}")
     
+    def _wait_for_send_slot(self):
+        """Sleep for whatever remains of the delay since the previous email"""
+        remaining = self._next_send_at - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+    
+    def _get_smtp(self) -> smtplib.SMTP_SSL:
+        """Return the authenticated Gmail SMTP connection, opening it if needed"""
+        if self._smtp is None:
+            server = smtplib.SMTP_SSL('smtp.gmail.com', 465)
+            try:
+                server.login(self.email_sender, self.email_password)
+            except Exception:
+                server.close()
+                raise
+            self._smtp = server
+        
+        return self._smtp
+    
     def _record_application(self, job_data: Dict, method: str):
-        """Record application in database"""
+        """Queue application for recording in database"""
+        application = dict(
+            job_id=str(job_data.get('job_id')),
+            company_name=job_data.get('company_name'),
+            job_title=job_data.get('job_title'),
+            job_url=job_data.get('job_url'),
+            job_description=job_data.get('job_description'),
+            location=job_data.get('location'),
+            job_board=job_data.get('job_board'),
+            date_applied=datetime.utcnow(),
+            application_method=method,
+            application_status='sent'
+        )
+        
+        self._pending.append(application)
+        
+        if len(self._pending) >= self.flush_every:
+            self.flush_applications()
+    
+    def flush_applications(self):
+        """Write buffered applications to the database in a single commit"""
+        if not self._pending:
+            return
+        
+        # A job applied to twice before a flush keeps its latest application
+        rows = list({row['job_id']: row for row in self._pending}.values())
+        
         try:
-            application = JobApplication(
-                job_id=str(job_data.get('job_id')),
-                company_name=job_data.get('company_name'),
-                job_title=job_data.get('job_title'),
-                job_url=job_data.get('job_url'),
-                job_description=job_data.get('job_description'),
-                location=job_data.get('location'),
-                job_board=job_data.get('job_board'),
-                date_applied=datetime.utcnow(),
-                application_method=method,
-                application_status='sent'
-            )
-            
-            self.db.add(application)
+            self._upsert_applications(rows)
             self.db.commit()
-            print(f"Application recorded in database")
+            print(f"{len(rows)} application(s) recorded in database")
+            self._pending.clear()
+            return
         
         except Exception as e:
-            print(f"Error recording application: {e}")
+            print(f"Error recording applications: {e}")
             self.db.rollback()
+        
+        # Fall back to one commit per row so a single bad row (e.g. a job_url
+        # already stored under another job_id) doesn't hold back the rest
+        failed = []
+        for row in rows:
+            try:
+                self._upsert_applications([row])
+                self.db.commit()
+            except Exception as e:
+                print(f"Error recording application to {row.get('company_name')}: {e}")
+                self.db.rollback()
+                failed.append(row)
+        
+        print(f"{len(rows) - len(failed)} application(s) recorded in database")
+        # Keep failed rows so the next flush retries them
+        self._pending = failed
+    
+    def _upsert_applications(self, rows: List[Dict]):
+        """Insert application rows, updating the stored row when a job is applied to again"""
+        if supports_on_conflict():
+            stmt = dialect_insert(JobApplication)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['job_id'],
+                set_={field: stmt.excluded[field] for field in _APPLIED_FIELDS + ('last_updated',)}
+            )
+            self.db.execute(stmt, rows)
+            return
+        
+        # Other dialects: update stored rows through the ORM and add the rest
+        stored = {
+            application.job_id: application
+            for application in self.db.scalars(
+                select(JobApplication).where(JobApplication.job_id.in_([row['job_id'] for row in rows]))
+            )
+        }
+        for row in rows:
+            application = stored.get(row['job_id'])
+            if application is None:
+                self.db.add(JobApplication(**row))
+            else:
+                for field in _APPLIED_FIELDS:
+                    setattr(application, field, row[field])
     
     def check_daily_limit(self) -> bool:
         """Check if daily application limit has been reached"""
         return self.applications_today >= config.MAX_APPLICATIONS_PER_DAY
     
     def close(self):
-        """Close database connection"""
+        """Flush pending applications and close SMTP and database connections"""
+        self.flush_applications()
+        
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._smtp = None
+        
         self.db.close()
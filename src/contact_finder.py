@@ -1,8 +1,25 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser
 from typing import Dict, Optional
+from collections import defaultdict
+from urllib.parse import urlparse, urlsplit, urlunsplit
+import threading
 import re
 
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+# French numbers, compact or grouped in pairs by spaces or dots: 0123456789, +33 1 23 45 67 89
+_PHONE_RE = re.compile(r'(?<!\d)(?:\+33\s?|0)[1-9](?:[\s.]?\d{2}){4}(?!\d)')
+_BAD_EMAIL_RE = re.compile(r'noreply|notification|bot', re.I)
+
+# Website lookups remembered per ContactFinder before the oldest are evicted
+CONTACT_CACHE_SIZE = 512
+
+def _normalize_url(url: str) -> str:
+    """Cache key for a URL: lowercase scheme and host, path, query; the fragment is dropped"""
+    parts = urlsplit(url.strip())
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', parts.query, ''))
+
 class ContactFinder:
     """Find company contact information"""
     
@@ -10,6 +27,19 @@ class ContactFinder:
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
+        
+        # Shared session so repeated hosts reuse pooled keep-alive connections
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=1)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # One lock per host so concurrent lookups never hit the same site in parallel
+        self._host_locks = defaultdict(threading.Lock)
+        
+        # Per-instance memo of website lookups keyed by normalized URL; failed fetches are not cached
+        self._contact_cache: Dict[str, Dict] = {}
     
     def find_company_info(self, company_name: str, company_website: Optional[str] = None) -> Dict:
         """
@@ -41,58 +71,87 @@ class ContactFinder:
     def _scrape_company_website(self, website_url: str) -> Dict:
         """Scrape company website for contact info"""
         try:
-            response = requests.get(website_url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            key = _normalize_url(website_url)
+            if key not in self._contact_cache:
+                contact_info = self._fetch_contact_info(website_url)
+                if len(self._contact_cache) >= CONTACT_CACHE_SIZE:
+                    self._contact_cache.pop(next(iter(self._contact_cache)))
+                self._contact_cache[key] = contact_info
             
-            # Extract emails
-            emails = self._extract_emails(soup.get_text())
-            
-            # Extract phone numbers
-            phones = self._extract_phone_numbers(soup.get_text())
-            
-            # Look for Contact page
-            contact_page = self._find_contact_page(soup, website_url)
-            
-            return {
-                'email': emails[0] if emails else None,
-                'phone': phones[0] if phones else None,
-                'has_contact_page': bool(contact_page),
-                'contact_page_url': contact_page
-            }
+            return dict(self._contact_cache[key])
         
         except Exception as e:
             print(f"Error in _scrape_company_website: {e}")
             return {}
     
+    def _fetch_contact_info(self, website_url: str) -> Dict:
+        """Fetch a company website and extract contact info from it"""
+        with self._host_locks[urlparse(website_url).netloc]:
+            response = self.session.get(website_url, timeout=10)
+        response.raise_for_status()
+        tree = LexborHTMLParser(response.text)
+        
+        # Scripts and styles hold timestamps and JSON blobs, not contact details
+        tree.strip_tags(['script', 'style'])
+        # Visible text, then mailto:/tel: targets for addresses only present in links
+        links = tree.css('a[href^="mailto:" i], a[href^="tel:" i]')
+        page_text = ' '.join([tree.body.text(separator=' ')] + [link.attributes.get('href') or '' for link in links])
+        
+        # Extract emails
+        emails = self._extract_emails(page_text)
+        
+        # Extract phone numbers
+        phones = self._extract_phone_numbers(page_text)
+        
+        # Look for Contact page
+        contact_page = self._find_contact_page(tree, website_url)
+        
+        return {
+            'email': emails[0] if emails else None,
+            'phone': phones[0] if phones else None,
+            'has_contact_page': bool(contact_page),
+            'contact_page_url': contact_page
+        }
+    
     @staticmethod
     def _extract_emails(text: str) -> list:
         """Extract email addresses from text"""
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        emails = re.findall(email_pattern, text)
+        emails = _EMAIL_RE.findall(text)
         # Filter out common non-contact emails
-        filtered = [e for e in emails if not any(x in e.lower() for x in ['noreply', 'notification', 'bot'])]
-        return list(set(filtered))[:5]  # Return unique, limit to 5
+        filtered = [e for e in emails if not _BAD_EMAIL_RE.search(e)]
+        return list(dict.fromkeys(filtered))[:5]  # Return unique in page order, limit to 5
     
     @staticmethod
     def _extract_phone_numbers(text: str) -> list:
         """Extract phone numbers from text"""
-        phone_pattern = r'\+?33[0-9]{9}|\+?33\s?[0-9]{9}|0[0-9]{9}'
-        phones = re.findall(phone_pattern, text)
-        return list(set(phones))[:3]
+        phones = _PHONE_RE.findall(text)
+        return list(dict.fromkeys(phones))[:3]
     
     @staticmethod
-    def _find_contact_page(soup: BeautifulSoup, base_url: str) -> Optional[str]:
+    def _find_contact_page(tree: LexborHTMLParser, base_url: str) -> Optional[str]:
         """Find contact page URL"""
-        for link in soup.find_all('a'):
-            href = link.get('href', '')
-            text = link.get_text(strip=True).lower()
-            
-            if 'contact' in text or 'contact' in href.lower():
-                if href.startswith('http'):
-                    return href
-                elif href.startswith('/'):
-                    return base_url.rstrip('/') + href
+        # Most contact links have "contact" in the URL; let the parser filter those
+        for link in tree.css('a[href*="contact" i]'):
+            url = ContactFinder._absolute_link(link.attributes.get('href') or '', base_url)
+            if url:
+                return url
+        
+        # Fall back to scanning link text, e.g. /nous-joindre labelled "Contact"
+        for link in tree.css('a'):
+            if 'contact' in link.text(strip=True).lower():
+                url = ContactFinder._absolute_link(link.attributes.get('href') or '', base_url)
+                if url:
+                    return url
+        
+        return None
+    
+    @staticmethod
+    def _absolute_link(href: str, base_url: str) -> Optional[str]:
+        """Resolve an absolute or site-relative link against base_url"""
+        if href.startswith('http'):
+            return href
+        elif href.startswith('/'):
+            return base_url.rstrip('/') + href
         
         return None
     
@@ -1,74 +1,172 @@
-from sqlalchemy import create_engine, Column, String, DateTime, Integer, Text, Boolean, Float
+import threading
+from sqlalchemy import create_engine, event, Column, Index, String, DateTime, Integer, Text, Boolean, Float
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import NullPool
 from datetime import datetime
 from config.config import config
 
-# Create database engine
-engine = create_engine(config.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+__all__ = [
+    "engine", "SessionLocal", "Base", "JobApplication",
+    "init_db", "get_db", "supports_on_conflict", "dialect_insert",
+]
+
 Base = declarative_base()
 
-class JobApplication(Base):
-    """Database model for job applications"""
-    __tablename__ = "job_applications"
-
-    id = Column(Integer, primary_key=True, index=True)
-    job_id = Column(String, unique=True, index=True)
-    company_name = Column(String, index=True)
-    job_title = Column(String, index=True)
-    job_url = Column(String, unique=True)
-    job_description = Column(Text)
-    salary_min = Column(Float, nullable=True)
-    salary_max = Column(Float, nullable=True)
-    location = Column(String, index=True)
-    job_board = Column(String)  # Indeed, LinkedIn, Glassdoor, etc.
-    posted_date = Column(DateTime, default=datetime.utcnow)
-    
-    # Contact information
-    company_contact_email = Column(String, nullable=True)
-    company_contact_phone = Column(String, nullable=True)
-    company_website = Column(String, nullable=True)
-    contact_person_name = Column(String, nullable=True)
-    contact_person_title = Column(String, nullable=True)
-    contact_person_email = Column(String, nullable=True)
-    
-    # Application tracking
-    date_applied = Column(DateTime, nullable=True)
-    application_method = Column(String)  # online_form, email, linkedin
-    application_status = Column(String, default="pending")  # pending, sent, rejected, accepted, interview
-    
-    # Response tracking
-    date_contacted = Column(DateTime, nullable=True)
-    response_type = Column(String, nullable=True)  # email, phone, linkedin, website
-    response_content = Column(Text, nullable=True)
+# Compiled SQL cache entries per engine (SQLAlchemy defaults to 500)
+QUERY_CACHE_SIZE = 1200
+
+# engine, SessionLocal and JobApplication are built on first access (PEP 562)
+# so importing this module does not connect to the database
+_lazy_lock = threading.RLock()
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune each new SQLite connection"""
+    cursor = dbapi_connection.cursor()
+    # WAL lets report reads proceed while applications are being written
+    cursor.execute("PRAGMA journal_mode=WAL")
+    # NORMAL is durable enough under WAL and syncs far less often than FULL
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+def _build_engine():
+    """Create database engine"""
+    url = make_url(config.DATABASE_URL)
     
-    # Interview details
-    interview_scheduled = Column(Boolean, default=False)
-    interview_date = Column(DateTime, nullable=True)
-    interview_time = Column(String, nullable=True)
-    interview_type = Column(String, nullable=True)  # phone, video, in_person
-    interview_location = Column(String, nullable=True)
+    if url.get_backend_name() == "sqlite":
+        connect_args = {"check_same_thread": False, "timeout": 30}
+        if url.database in (None, "", ":memory:"):
+            # In-memory databases live and die with their connection; keep the default pool
+            engine = create_engine(url, connect_args=connect_args, query_cache_size=QUERY_CACHE_SIZE)
+        else:
+            # One-shot CLI runs gain nothing from idle pooled connections to a file
+            engine = create_engine(
+                url, poolclass=NullPool, connect_args=connect_args, query_cache_size=QUERY_CACHE_SIZE
+            )
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+        return engine
     
-    # Feedback and notes
-    notes = Column(Text, nullable=True)
-    feedback = Column(Text, nullable=True)
-    rejection_reason = Column(String, nullable=True)
+    # Long-running server databases: detect connections dropped while idle in the pool
+    return create_engine(url, pool_pre_ping=True, query_cache_size=QUERY_CACHE_SIZE)
+
+def _build_session_factory():
+    """Create session factory bound to the engine"""
+    return sessionmaker(autocommit=False, autoflush=False, bind=_lazy("engine"))
+
+def _build_job_application():
+    """Declare the JobApplication model"""
     
-    # Last updated
-    last_updated = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    class JobApplication(Base):
+        """Database model for job applications"""
+        __tablename__ = "job_applications"
+        __table_args__ = (
+            Index("ix_app_company_status", "company_name", "application_status"),
+            Index("ix_app_status", "application_status"),
+            Index("ix_app_interview", "interview_scheduled", "interview_date"),
+            Index("ix_app_date_applied", "date_applied"),
+            Index("ix_app_date_contacted", "date_contacted"),
+        )
+
+        id = Column(Integer, primary_key=True, index=True)
+        job_id = Column(String, unique=True, index=True)
+        company_name = Column(String, index=True)
+        job_title = Column(String, index=True)
+        job_url = Column(String, unique=True)
+        job_description = Column(Text)
+        salary_min = Column(Float, nullable=True)
+        salary_max = Column(Float, nullable=True)
+        location = Column(String, index=True)
+        job_board = Column(String)  # Indeed, LinkedIn, Glassdoor, etc.
+        posted_date = Column(DateTime, default=datetime.utcnow)
+        
+        # Contact information
+        company_contact_email = Column(String, nullable=True)
+        company_contact_phone = Column(String, nullable=True)
+        company_website = Column(String, nullable=True)
+        contact_person_name = Column(String, nullable=True)
+        contact_person_title = Column(String, nullable=True)
+        contact_person_email = Column(String, nullable=True)
+        
+        # Application tracking
+        date_applied = Column(DateTime, nullable=True)
+        application_method = Column(String)  # online_form, email, linkedin
+        application_status = Column(String, default="pending")  # pending, sent, rejected, accepted, interview
+        
+        # Response tracking
+        date_contacted = Column(DateTime, nullable=True)
+        response_type = Column(String, nullable=True)  # email, phone, linkedin, website
+        response_content = Column(Text, nullable=True)
+        
+        # Interview details
+        interview_scheduled = Column(Boolean, default=False)
+        interview_date = Column(DateTime, nullable=True)
+        interview_time = Column(String, nullable=True)
+        interview_type = Column(String, nullable=True)  # phone, video, in_person
+        interview_location = Column(String, nullable=True)
+        
+        # Feedback and notes
+        notes = Column(Text, nullable=True)
+        feedback = Column(Text, nullable=True)
+        rejection_reason = Column(String, nullable=True)
+        
+        # Last updated
+        last_updated = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+        
+    return JobApplication
+
+_LAZY_ATTRIBUTES = {
+    "engine": _build_engine,
+    "SessionLocal": _build_session_factory,
+    "JobApplication": _build_job_application,
+}
+
+def _lazy(name):
+    """Build a lazy module attribute on first use and cache it in the module namespace"""
+    with _lazy_lock:
+        if name not in globals():
+            globals()[name] = _LAZY_ATTRIBUTES[name]()
+    return globals()[name]
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _lazy(name)
 
 def get_db():
     """Database dependency"""
-    db = SessionLocal()
+    db = _lazy("SessionLocal")()
     try:
         yield db
     finally:
         db.close()
 
+# Dialects whose INSERT supports ON CONFLICT clauses
+_ON_CONFLICT_DIALECTS = ("postgresql", "sqlite")
+
+def supports_on_conflict() -> bool:
+    """Whether the engine's dialect supports INSERT ... ON CONFLICT"""
+    return _lazy("engine").dialect.name in _ON_CONFLICT_DIALECTS
+
+def dialect_insert(model):
+    """INSERT construct with ON CONFLICT clauses; only call when supports_on_conflict()"""
+    if _lazy("engine").dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(model)
+
 def init_db():
     """Initialize database"""
+    JobApplication = _lazy("JobApplication")  # register the table on Base.metadata
+    engine = _lazy("engine")
     Base.metadata.create_all(bind=engine)
+    
+    # create_all skips existing tables, so add indexes introduced since an older database was made
+    for index in JobApplication.__table__.indexes:
+        index.create(bind=engine, checkfirst=True)
     print("Database initialized successfully!")
 
 if __name__ == "__main__":
@@ -1,3 +1,4 @@
+import logging
 import os
 import sys
 from config.config import config
@@ -6,10 +7,16 @@ from src.scraper import IndeedScraper
 from src.applicator import ApplicationManager
 from src.reporter import ReportGenerator, print_status_summary
 from src.contact_finder import ContactFinder
-import time
+from concurrent.futures import ThreadPoolExecutor
+
+def _company_key(job):
+    """Key identifying the company behind a job posting"""
+    return job.get('company_website') or job.get('company_name')
 
 def main():
     """Main application flow"""
+    # Scraper and reporter messages go through logging; show them like plain output
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
     
     print("="*60)
     print("JOB APPLICATION AUTOMATION TOOL - Île-de-France")
@@ -33,12 +40,28 @@ def main():
     # Enrich job data with contact information
     print("\n[3/6] Finding company contact information...")
     contact_finder = ContactFinder()
-    for job in jobs[:min(5, len(jobs))]:  # Process first 5 jobs
-        job = contact_finder.enrich_job_posting(job)
+    jobs_to_enrich = jobs[:5]  # Process first 5 jobs
+    
+    # Look each company up once, keyed by website or, failing that, by name
+    unique_jobs = {}
+    for job in jobs_to_enrich:
+        unique_jobs.setdefault(_company_key(job), job)
+    
+    # Lookups hit different sites, so run them concurrently; ContactFinder
+    # serializes requests to the same host
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        enriched = dict(zip(unique_jobs, executor.map(contact_finder.enrich_job_posting, unique_jobs.values())))
+    
+    for job in jobs_to_enrich:
+        source = enriched[_company_key(job)]
+        if source is not job:
+            job['company_contact_email'] = source.get('company_contact_email')
+            job['company_contact_phone'] = source.get('company_contact_phone')
+            job['company_website'] = source.get('company_website')
         print(f"  ✓ Enriched: {job.get('company_name')}")
-        time.sleep(1)  # Be respectful to servers
     
-    # Apply to jobs
+    # Apply to jobs; ApplicationManager spaces out emails by
+    # APPLICATION_DELAY_SECONDS, counting time spent on other work
     print("\n[4/6] Applying to jobs...")
     applicator = ApplicationManager()
     applied_count = 0
@@ -51,7 +74,6 @@ def main():
         success = applicator.apply_to_job(job, method="email")
         if success:
             applied_count += 1
-            time.sleep(config.APPLICATION_DELAY_SECONDS)
     
     print(f"✓ Applied to {applied_count} jobs")
     applicator.close()
@@ -1,58 +1,77 @@
-import pandas as pd
+import logging
 from datetime import datetime, timedelta
-from typing import Dict, List
-from sqlalchemy import func
+from typing import Dict, Iterable, List
+from openpyxl import Workbook
+from sqlalchemy import and_, case, func, or_, select
 from src.database import SessionLocal, JobApplication
 
+logger = logging.getLogger(__name__)
+
+def _stream_to_xlsx(columns: List[str], rows: Iterable[tuple], output_path: str):
+    """Stream rows to an Excel file using openpyxl's write-only mode"""
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('Sheet1')
+    sheet.append(columns)
+    
+    for row in rows:
+        sheet.append(tuple(row))
+    
+    workbook.save(output_path)
+
 class ReportGenerator:
     """Generate reports from application data"""
     
     def __init__(self):
         self.db = SessionLocal()
     
+    def _fetch_and_release(self, stmt) -> List[tuple]:
+        """Run a report query and hand its connection back before the slow xlsx write"""
+        rows = self.db.execute(stmt).all()
+        self.db.close()
+        return rows
+    
     def generate_all_applications_report(self, output_path: str = "reports/all_applications.xlsx"):
         """Generate report of all applications"""
         try:
-            applications = self.db.query(JobApplication).all()
-            
-            data = []
-            for app in applications:
-                data.append({
-                    'Company Name': app.company_name,
-                    'Job Title': app.job_title,
-                    'Location': app.location,
-                    'Job Board': app.job_board,
-                    'Posted Date': app.posted_date,
-                    'Date Applied': app.date_applied,
-                    'Application Status': app.application_status,
-                    'Date Contacted': app.date_contacted,
-                    'Response Type': app.response_type,
-                    'Interview Scheduled': app.interview_scheduled,
-                    'Interview Date': app.interview_date,
-                    'Interview Type': app.interview_type,
-                    'Company Email': app.company_contact_email,
-                    'Company Phone': app.company_contact_phone,
-                    'Notes': app.notes
-                })
+            columns = [
+                'Company Name', 'Job Title', 'Location', 'Job Board', 'Posted Date',
+                'Date Applied', 'Application Status', 'Date Contacted', 'Response Type',
+                'Interview Scheduled', 'Interview Date', 'Interview Type',
+                'Company Email', 'Company Phone', 'Notes'
+            ]
+            stmt = select(
+                JobApplication.company_name, JobApplication.job_title, JobApplication.location,
+                JobApplication.job_board, JobApplication.posted_date, JobApplication.date_applied,
+                JobApplication.application_status, JobApplication.date_contacted,
+                JobApplication.response_type, JobApplication.interview_scheduled,
+                JobApplication.interview_date, JobApplication.interview_type,
+                JobApplication.company_contact_email, JobApplication.company_contact_phone,
+                JobApplication.notes
+            )
             
-            df = pd.DataFrame(data)
-            df.to_excel(output_path, index=False)
-            print(f"Report generated: {output_path}")
-            return df
+            _stream_to_xlsx(columns, self._fetch_and_release(stmt), output_path)
+            logger.info("Report generated: %s", output_path)
+            return output_path
         
         except Exception as e:
-            print(f"Error generating report: {e}")
+            logger.warning("Error generating report: %s", e)
             return None
     
     def generate_status_summary(self) -> Dict:
         """Generate summary of application statuses"""
         try:
-            total = self.db.query(func.count(JobApplication.id)).scalar()
-            sent = self.db.query(func.count(JobApplication.id)).filter(JobApplication.application_status == 'sent').scalar()
-            pending = self.db.query(func.count(JobApplication.id)).filter(JobApplication.application_status == 'pending').scalar()
-            rejected = self.db.query(func.count(JobApplication.id)).filter(JobApplication.application_status == 'rejected').scalar()
-            accepted = self.db.query(func.count(JobApplication.id)).filter(JobApplication.application_status == 'accepted').scalar()
-            interview = self.db.query(func.count(JobApplication.id)).filter(JobApplication.application_status == 'interview').scalar()
+            rows = self.db.execute(
+                select(JobApplication.application_status, func.count(JobApplication.id))
+                .group_by(JobApplication.application_status)
+            ).all()
+            counts = dict(rows)
+            
+            total = sum(counts.values())
+            sent = counts.get('sent', 0)
+            pending = counts.get('pending', 0)
+            rejected = counts.get('rejected', 0)
+            accepted = counts.get('accepted', 0)
+            interview = counts.get('interview', 0)
             
             return {
                 'Total Applications': total,
@@ -65,66 +84,57 @@ class ReportGenerator:
             }
         
         except Exception as e:
-            print(f"Error generating status summary: {e}")
+            logger.warning("Error generating status summary: %s", e)
             return {}
     
     def generate_company_contact_report(self, output_path: str = "reports/company_contacts.xlsx"):
         """Generate report with company contact information"""
         try:
-            applications = self.db.query(JobApplication).filter(
+            columns = [
+                'Company Name', 'Contact Email', 'Contact Phone', 'Company Website',
+                'Contact Person', 'Contact Title', 'Last Updated'
+            ]
+            stmt = select(
+                JobApplication.company_name, JobApplication.company_contact_email,
+                JobApplication.company_contact_phone, JobApplication.company_website,
+                JobApplication.contact_person_name, JobApplication.contact_person_title,
+                JobApplication.last_updated
+            ).where(
                 JobApplication.company_contact_email.isnot(None)
-            ).all()
-            
-            data = []
-            for app in applications:
-                data.append({
-                    'Company Name': app.company_name,
-                    'Contact Email': app.company_contact_email,
-                    'Contact Phone': app.company_contact_phone,
-                    'Company Website': app.company_website,
-                    'Contact Person': app.contact_person_name,
-                    'Contact Title': app.contact_person_title,
-                    'Last Updated': app.last_updated
-                })
+            )
             
-            df = pd.DataFrame(data)
-            df.to_excel(output_path, index=False)
-            print(f"Contact report generated: {output_path}")
-            return df
+            _stream_to_xlsx(columns, self._fetch_and_release(stmt), output_path)
+            logger.info("Contact report generated: %s", output_path)
+            return output_path
         
         except Exception as e:
-            print(f"Error generating contact report: {e}")
+            logger.warning("Error generating contact report: %s", e)
             return None
     
     def generate_interview_schedule(self, output_path: str = "reports/interview_schedule.xlsx"):
         """Generate upcoming interview schedule"""
         try:
-            upcoming = self.db.query(JobApplication).filter(
+            columns = [
+                'Company Name', 'Job Title', 'Interview Date', 'Interview Time',
+                'Interview Type', 'Interview Location', 'Contact Email', 'Contact Phone', 'Notes'
+            ]
+            stmt = select(
+                JobApplication.company_name, JobApplication.job_title,
+                JobApplication.interview_date, JobApplication.interview_time,
+                JobApplication.interview_type, JobApplication.interview_location,
+                JobApplication.company_contact_email, JobApplication.company_contact_phone,
+                JobApplication.notes
+            ).where(
                 JobApplication.interview_scheduled == True,
                 JobApplication.interview_date >= datetime.utcnow()
-            ).order_by(JobApplication.interview_date).all()
+            ).order_by(JobApplication.interview_date)
             
-            data = []
-            for app in upcoming:
-                data.append({
-                    'Company Name': app.company_name,
-                    'Job Title': app.job_title,
-                    'Interview Date': app.interview_date,
-                    'Interview Time': app.interview_time,
-                    'Interview Type': app.interview_type,
-                    'Interview Location': app.interview_location,
-                    'Contact Email': app.company_contact_email,
-                    'Contact Phone': app.company_contact_phone,
-                    'Notes': app.notes
-                })
-            
-            df = pd.DataFrame(data)
-            df.to_excel(output_path, index=False)
-            print(f"Interview schedule generated: {output_path}")
-            return df
+            _stream_to_xlsx(columns, self._fetch_and_release(stmt), output_path)
+            logger.info("Interview schedule generated: %s", output_path)
+            return output_path
         
         except Exception as e:
-            print(f"Error generating interview schedule: {e}")
+            logger.warning("Error generating interview schedule: %s", e)
             return None
     
     def generate_weekly_report(self, output_path: str = "reports/weekly_report.xlsx"):
@@ -132,41 +142,49 @@ class ReportGenerator:
         try:
             week_ago = datetime.utcnow() - timedelta(days=7)
             
-            applications_this_week = self.db.query(JobApplication).filter(
-                JobApplication.date_applied >= week_ago
-            ).all()
+            applied = JobApplication.date_applied >= week_ago
+            responded = JobApplication.date_contacted >= week_ago
             
-            responses_this_week = self.db.query(JobApplication).filter(
-                JobApplication.date_contacted >= week_ago
-            ).all()
+            # Every count comes back from one aggregate row; responses keep their own date window
+            stmt = select(
+                func.sum(case((applied, 1), else_=0)).label('applied'),
+                func.sum(case((responded, 1), else_=0)).label('responses'),
+                func.sum(case((and_(responded, JobApplication.interview_scheduled == True), 1), else_=0)).label('interviews'),
+                func.sum(case((and_(responded, JobApplication.application_status == 'rejected'), 1), else_=0)).label('rejections'),
+                func.sum(case((and_(responded, JobApplication.application_status == 'accepted'), 1), else_=0)).label('offers')
+            ).where(or_(applied, responded))
+            counts, = self._fetch_and_release(stmt)
+            
+            # SUM over no rows is NULL
+            applications_sent = counts.applied or 0
+            responses_received = counts.responses or 0
             
             data = {
                 'Week Starting': week_ago.strftime('%Y-%m-%d'),
-                'Applications Sent': len(applications_this_week),
-                'Responses Received': len(responses_this_week),
-                'Response Rate': f"{len(responses_this_week) / len(applications_this_week) * 100:.1f}%" if applications_this_week else "0%",
-                'Interviews Scheduled': len([a for a in responses_this_week if a.interview_scheduled]),
-                'Rejections': len([a for a in responses_this_week if a.application_status == 'rejected']),
-                'Offers': len([a for a in responses_this_week if a.application_status == 'accepted'])
+                'Applications Sent': applications_sent,
+                'Responses Received': responses_received,
+                'Response Rate': f"{responses_received / applications_sent * 100:.1f}%" if applications_sent else "0%",
+                'Interviews Scheduled': counts.interviews or 0,
+                'Rejections': counts.rejections or 0,
+                'Offers': counts.offers or 0
             }
             
-            df = pd.DataFrame([data])
-            df.to_excel(output_path, index=False)
-            print(f"Weekly report generated: {output_path}")
-            return df
+            _stream_to_xlsx(list(data), [tuple(data.values())], output_path)
+            logger.info("Weekly report generated: %s", output_path)
+            return output_path
         
         except Exception as e:
-            print(f"Error generating weekly report: {e}")
+            logger.warning("Error generating weekly report: %s", e)
             return None
     
     def get_application_by_company(self, company_name: str) -> JobApplication:
         """Get application details for a specific company"""
         try:
-            return self.db.query(JobApplication).filter(
-                JobApplication.company_name == company_name
+            return self.db.scalars(
+                select(JobApplication).where(JobApplication.company_name == company_name).limit(1)
             ).first()
         except Exception as e:
-            print(f"Error retrieving application: {e}")
+            logger.warning("Error retrieving application: %s", e)
             return None
     
     def close(self):
@@ -178,6 +196,7 @@ def print_status_summary():
     """Print status summary to console"""
     generator = ReportGenerator()
     summary = generator.generate_status_summary()
+    generator.close()
     
     print("\n" + "="*50)
     print("APPLICATION STATUS SUMMARY")
@@ -187,4 +206,3 @@ def print_status_summary():
         print(f"{key:.<40} {value}")
     
     print("="*50 + "\n")
-    generator.close()
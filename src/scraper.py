@@ -1,21 +1,154 @@
+import hashlib
+import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+from lxml import etree, html as lxhtml
 from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import List, Dict, Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import threading
 import time
 import re
 from config.config import config
-from urllib.parse import urljoin
+from urllib.parse import quote_plus, urljoin
+
+logger = logging.getLogger(__name__)
+
+INDEED_BASE = config.INDEED_BASE_URL
+
+def _class_xpath(path: str, css_class: str) -> str:
+    """XPath step matching elements whose class attribute contains css_class as a whole token"""
+    return f"{path}[contains(concat(' ', normalize-space(@class), ' '), ' {css_class} ')]"
+
+# Job cards on a results page, and the first element of each field within a card, compiled once
+_CARDS_XP = etree.XPath(_class_xpath('//div', 'job_seen_beacon'))
+_CARD_FIELDS_XP = {
+    field: etree.XPath(f"({_class_xpath(path, css_class)})[1]")
+    for field, path, css_class in (
+        ('title', './/h2', 'jobTitle'),
+        ('company', './/span', 'companyName'),
+        ('link', './/a', 'jcs-JobTitle'),
+        ('location', './/div', 'companyLocation'),
+        ('snippet', './/div', 'job-snippet'),
+        ('salary', './/span', 'salary-snippet'),
+    )
+}
+
+# Text nodes under a field, skipping script/style bodies as get_text() did
+_TEXT_XP = etree.XPath('.//text()[not(parent::script or parent::style)]')
+
+# Indeed serves UTF-8; don't let libxml2 fall back to Latin-1 on pages without a charset
+_HTML_PARSER = lxhtml.HTMLParser(encoding='utf-8')
+
+def _field_text(job_card, field: str, default: Optional[str] = "N/A") -> Optional[str]:
+    """Text of a card field with each text node stripped, or default when the card lacks it"""
+    matches = _CARD_FIELDS_XP[field](job_card)
+    return ''.join(text.strip() for text in _TEXT_XP(matches[0])) if matches else default
+
+def _job_id(job_url: str) -> int:
+    """Stable 64-bit id for a job URL (builtin hash() is salted per process)"""
+    return int.from_bytes(hashlib.blake2b(job_url.encode(), digest_size=8).digest(), 'little')
+
+def _extract_card(job_card, source_url: str, base_url: str) -> Optional[Dict]:
+    """Extract job information from an Indeed job card"""
+    try:
+        job_title = _field_text(job_card, 'title')
+        company_name = _field_text(job_card, 'company')
+        links = _CARD_FIELDS_XP['link'](job_card)
+        job_url = urljoin(base_url, links[0].attrib['href']) if links else "N/A"
+        location = _field_text(job_card, 'location')
+        description = _field_text(job_card, 'snippet')
+        salary = _field_text(job_card, 'salary', default=None)
+        
+        return {
+            'job_id': _job_id(job_url),
+            'company_name': company_name,
+            'job_title': job_title,
+            'job_url': job_url,
+            'job_description': description,
+            'location': location,
+            'salary': salary,
+            'job_board': 'Indeed',
+            'posted_date': datetime.utcnow(),
+            'source_url': source_url
+        }
+    except Exception as e:
+        logger.debug("Error in _extract_job_info: %s", e)
+        return None
+
+def parse_page_bytes(content: bytes, source_url: str, base_url: str = INDEED_BASE) -> List[Dict]:
+    """Parse every job card on an Indeed results page (runs in a worker process)"""
+    tree = lxhtml.fromstring(content, parser=_HTML_PARSER)
+    jobs = []
+    
+    for job_card in _CARDS_XP(tree):
+        try:
+            job_data = _extract_card(job_card, source_url, base_url)
+            if job_data:
+                jobs.append(job_data)
+        except Exception as e:
+            logger.debug("Error extracting job: %s", e)
+            continue
+    
+    return jobs
+
+# Result pages per search below which parsing stays in-process; a few pages
+# parse in milliseconds, far less than starting worker processes
+PROCESS_PARSE_MIN_PAGES = 20
+
+# Parse workers shared for the module's lifetime; False once they have failed to start
+_parse_pool = None
+_parse_pool_lock = threading.Lock()
+
+def _get_parse_pool() -> Optional[ProcessPoolExecutor]:
+    """Shared process pool for parsing result pages, or None if workers can't run here"""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            # Spawned rather than forked since fetch threads are already running
+            _parse_pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context('spawn'))
+        return _parse_pool or None
+
+def _disable_parse_pool():
+    """Stop using parse workers, e.g. when spawn can't re-import __main__ (stdin, -c)"""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool:
+            _parse_pool.shutdown(wait=False)
+        _parse_pool = False
+
+def _build_session(headers: Dict) -> requests.Session:
+    """HTTP session with pooled keep-alive connections and retries with backoff"""
+    session = requests.Session()
+    session.headers.update(headers)
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.5)
+    )
+    session.mount('https://', adapter)
+    return session
 
 class IndeedScraper:
     """Scraper for Indeed job postings"""
     
+    # Minimum seconds between the start of two requests to Indeed
+    REQUEST_INTERVAL = 2.0
+    # Result pages fetched concurrently
+    MAX_CONCURRENT_PAGES = 3
+    
     def __init__(self):
-        self.base_url = config.INDEED_BASE_URL
+        self.base_url = INDEED_BASE
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
-        self.session = requests.Session()
+        self.session = _build_session(self.headers)
+        self._throttle_lock = threading.Lock()
+        self._next_request_at = 0.0
     
     def search_jobs(self, keywords: str, location: str = "Île-de-France", pages: int = 5) -> List[Dict]:
         """
@@ -31,83 +164,82 @@ class IndeedScraper:
         """
         jobs = []
         
-        for page in range(pages):
+        # Indeed search URL format
+        query = quote_plus(keywords)
+        where = quote_plus(location)
+        urls = [
+            f"{INDEED_BASE}/jobs?q={query}&l={where}&start={page * 10}"
+            for page in range(pages)
+        ]
+        
+        # Large searches hand pages to the shared worker processes as they arrive
+        parser = _get_parse_pool() if pages >= PROCESS_PARSE_MIN_PAGES else None
+        
+        # Fetch pages concurrently, collecting them in page order
+        with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_PAGES) as fetcher:
+            fetches = [fetcher.submit(self._fetch_page, url) for url in urls]
+            fetched = []
+            
+            for url, fetch in zip(urls, fetches):
+                try:
+                    content = fetch.result()
+                    parse = parser.submit(parse_page_bytes, content, url) if parser else None
+                    fetched.append((url, content, parse))
+                except Exception as e:
+                    fetched.append(e)
+        
+        # Result pages repeat listings; keep the first posting of each job id
+        seen = set()
+        for page, result in enumerate(fetched):
             try:
-                # Indeed search URL format
-                url = f"{self.base_url}/jobs?q={keywords}&l={location}&start={page * 10}"
-                response = self.session.get(url, headers=self.headers, timeout=10)
-                response.raise_for_status()
+                if isinstance(result, Exception):
+                    raise result
+                url, content, parse = result
                 
-                soup = BeautifulSoup(response.content, 'html.parser')
-                job_cards = soup.find_all('div', class_='job_seen_beacon')
+                try:
+                    page_jobs = parse.result() if parse else parse_page_bytes(content, url)
+                except BrokenProcessPool as e:
+                    if parser is not None:
+                        logger.warning("Parse workers unavailable, parsing in-process: %s", e)
+                        _disable_parse_pool()
+                        parser = None
+                    page_jobs = parse_page_bytes(content, url)
                 
-                for job_card in job_cards:
-                    try:
-                        job_data = self._extract_job_info(job_card, url)
-                        if job_data:
-                            jobs.append(job_data)
-                    except Exception as e:
-                        print(f"Error extracting job: {e}")
+                for job_data in page_jobs:
+                    if job_data['job_id'] in seen:
                         continue
-                
-                # Be respectful to the server
-                time.sleep(2)
-                
+                    seen.add(job_data['job_id'])
+                    jobs.append(job_data)
+            
             except Exception as e:
-                print(f"Error scraping page {page}: {e}")
+                logger.warning("Error scraping page %d: %s", page, e)
                 continue
         
         return jobs
     
+    def _fetch_page(self, url: str) -> bytes:
+        """Fetch a results page, spacing request starts by REQUEST_INTERVAL"""
+        # Be respectful to the server
+        with self._throttle_lock:
+            wait = self._next_request_at - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._next_request_at = time.monotonic() + self.REQUEST_INTERVAL
+        
+        response = self.session.get(url, timeout=10)
+        response.raise_for_status()
+        return response.content
+    
     def _extract_job_info(self, job_card, source_url: str) -> Dict:
         """Extract job information from Indeed job card"""
-        try:
-            # Job title
-            title_elem = job_card.find('h2', class_='jobTitle')
-            job_title = title_elem.get_text(strip=True) if title_elem else "N/A"
-            
-            # Company name
-            company_elem = job_card.find('span', class_='companyName')
-            company_name = company_elem.get_text(strip=True) if company_elem else "N/A"
-            
-            # Job URL
-            job_link = job_card.find('a', class_='jcs-JobTitle')
-            job_url = urljoin(self.base_url, job_link['href']) if job_link else "N/A"
-            
-            # Location
-            location_elem = job_card.find('div', class_='companyLocation')
-            location = location_elem.get_text(strip=True) if location_elem else "N/A"
-            
-            # Job description snippet
-            snippet_elem = job_card.find('div', class_='job-snippet')
-            description = snippet_elem.get_text(strip=True) if snippet_elem else "N/A"
-            
-            # Salary (if available)
-            salary_elem = job_card.find('span', class_='salary-snippet')
-            salary = salary_elem.get_text(strip=True) if salary_elem else None
-            
-            return {
-                'job_id': hash(job_url) % 10**8,
-                'company_name': company_name,
-                'job_title': job_title,
-                'job_url': job_url,
-                'job_description': description,
-                'location': location,
-                'salary': salary,
-                'job_board': 'Indeed',
-                'posted_date': datetime.utcnow(),
-                'source_url': source_url
-            }
-        except Exception as e:
-            print(f"Error in _extract_job_info: {e}")
-            return None
+        return _extract_card(job_card, source_url, self.base_url)
     
     def get_job_details(self, job_url: str) -> Dict:
         """Get full job details from job posting page"""
         try:
-            response = self.session.get(job_url, headers=self.headers, timeout=10)
+            response = self.session.get(job_url, timeout=10)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             # Full description
             desc_elem = soup.find('div', id='jobDescription')
@@ -115,7 +247,7 @@ class IndeedScraper:
             
             return {'full_description': full_description}
         except Exception as e:
-            print(f"Error getting job details: {e}")
+            logger.warning("Error getting job details: %s", e)
             return {}
 
 
@@ -127,6 +259,7 @@ class LinkedInScraper:
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
+        self.session = _build_session(self.headers)
     
     def search_jobs(self, keywords: str, location: str = "Île-de-France", pages: int = 3) -> List[Dict]:
         """
@@ -145,14 +278,14 @@ class LinkedInScraper:
         
         try:
             # LinkedIn search URL
-            search_query = keywords.replace(" ", "%20")
-            location_query = location.replace(" ", "%20")
+            search_query = quote_plus(keywords)
+            location_query = quote_plus(location)
             
             # Note: Direct scraping LinkedIn may violate ToS. Use their official API instead.
-            print("Note: For production, use LinkedIn's official API instead of scraping.")
+            logger.info("Note: For production, use LinkedIn's official API instead of scraping.")
             
         except Exception as e:
-            print(f"Error searching LinkedIn jobs: {e}")
+            logger.warning("Error searching LinkedIn jobs: %s", e)
         
         return jobs
 
@@ -165,6 +298,7 @@ class GlassdoorScraper:
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
+        self.session = _build_session(self.headers)
     
     def search_jobs(self, keywords: str, location: str = "Île-de-France", pages: int = 3) -> List[Dict]:
         """
@@ -181,9 +315,9 @@ class GlassdoorScraper:
         jobs = []
         
         try:
-            print("Glassdoor scraping - Note: Heavy anti-scraping protection. Consider API alternatives.")
+            logger.info("Glassdoor scraping - Note: Heavy anti-scraping protection. Consider API alternatives.")
             
         except Exception as e:
-            print(f"Error searching Glassdoor jobs: {e}")
+            logger.warning("Error searching Glassdoor jobs: %s", e)
         
         return jobs
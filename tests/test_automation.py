@@ -1,73 +1,238 @@
-import unittest
-from unittest.mock import patch, MagicMock
-from src.scraper import IndeedScraper
+import pytest
+from unittest.mock import patch
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from datetime import datetime, timedelta
+from openpyxl import load_workbook
+from src import applicator, database, reporter
+from src.scraper import IndeedScraper, _job_id
 from src.applicator import ApplicationManager
 from src.contact_finder import ContactFinder
 
 
-class TestIndeedScraper(unittest.TestCase):
+@pytest.fixture(scope='module')
+def scraper():
+    return IndeedScraper()
+
+
+@pytest.fixture(scope='module')
+def manager():
+    manager = ApplicationManager()
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def session_factory(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'applications.db'}")
+    database.Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(database, 'engine', engine)
+    monkeypatch.setattr(database, 'SessionLocal', factory)
+    monkeypatch.setattr(applicator, 'SessionLocal', factory)
+    monkeypatch.setattr(reporter, 'SessionLocal', factory)
+    yield factory
+    engine.dispose()
+
+
+class TestIndeedScraper:
     """Test suite for Indeed scraper"""
     
-    def setUp(self):
-        self.scraper = IndeedScraper()
-    
-    def test_scraper_initialization(self):
+    def test_scraper_initialization(self, scraper):
         """Test scraper initialization"""
-        self.assertIsNotNone(self.scraper.base_url)
-        self.assertIsNotNone(self.scraper.headers)
+        assert scraper.base_url is not None
+        assert scraper.headers is not None
     
-    @patch('src.scraper.requests.Session.get')
-    def test_search_jobs(self, mock_get):
-        """Test job search"""
-        # This would require mocking HTTP responses
-        pass
+    def test_job_id_is_deterministic(self):
+        """Test job ids do not depend on the interpreter's hash seed"""
+        assert _job_id('https://www.indeed.com/rc/clk?jk=aaa') == 7631909713375297781
+        assert _job_id('https://www.indeed.com/rc/clk?jk=aaa') != _job_id('https://www.indeed.com/rc/clk?jk=bbb')
+    
+    def test_search_jobs(self, scraper):
+        """Test job search drops listings repeated across pages"""
+        with patch('src.scraper.requests.Session.get') as mock_get, patch('src.scraper.time.sleep'):
+            mock_get.return_value.content = (
+                b'<div class="job_seen_beacon"><h2 class="jobTitle">Python Dev</h2>'
+                b'<a class="jcs-JobTitle" href="/rc/clk?jk=aaa"></a>'
+                b'<span class="companyName">Acme</span></div>'
+            )
+            jobs = scraper.search_jobs('python', 'Paris', pages=2)
+        
+        assert len(jobs) == 1
+        assert jobs[0]['company_name'] == 'Acme'
+        assert jobs[0]['job_url'] == 'https://www.indeed.com/rc/clk?jk=aaa'
     
     def test_extract_emails(self):
         """Test email extraction"""
         text = "Contact us at test@example.com or support@company.fr"
         emails = ContactFinder._extract_emails(text)
-        self.assertIn('test@example.com', emails)
-        self.assertIn('support@company.fr', emails)
+        assert 'test@example.com' in emails
+        assert 'support@company.fr' in emails
     
     def test_extract_phone_numbers(self):
         """Test phone number extraction"""
         text = "Call us at +33 1 23 45 67 89 or 0123456789"
         phones = ContactFinder._extract_phone_numbers(text)
-        self.assertTrue(len(phones) > 0)
+        assert len(phones) > 0
 
 
-class TestApplicationManager(unittest.TestCase):
+class TestApplicationManager:
     """Test suite for application manager"""
     
-    def setUp(self):
-        self.manager = ApplicationManager()
-    
-    def test_daily_limit(self):
+    def test_daily_limit(self, manager):
         """Test daily application limit"""
-        self.manager.applications_today = 0
-        self.assertFalse(self.manager.check_daily_limit())
+        manager.applications_today = 0
+        assert not manager.check_daily_limit()
         
-        self.manager.applications_today = 5
-        self.assertTrue(self.manager.check_daily_limit())
+        manager.applications_today = 5
+        assert manager.check_daily_limit()
 
+    
+    def test_flush_marks_saved_job_sent(self, session_factory):
+        """Test applying to a stored job updates its row instead of duplicating it"""
+        with session_factory() as db:
+            db.add(database.JobApplication(job_id='1', job_url='https://example.com/1', company_name='Acme'))
+            db.commit()
+        
+        manager = ApplicationManager()
+        manager._record_application({'job_id': 1, 'job_url': 'https://example.com/1', 'company_name': 'Acme'}, 'email')
+        manager.close()
+        
+        with session_factory() as db:
+            applications = db.scalars(select(database.JobApplication)).all()
+        assert [(a.job_id, a.application_status, a.application_method) for a in applications] == [('1', 'sent', 'email')]
 
-class TestContactFinder(unittest.TestCase):
-    """Test suite for contact finder"""
     
-    def setUp(self):
-        self.finder = ContactFinder()
+    def test_cover_letter_blanks_missing_fields(self, manager):
+        """Test None values from the database render as blanks"""
+        letter = manager._generate_cover_letter({'job_title': 'Data Engineer', 'company_name': 'Acme', 'location': None})
+        assert 'None' not in letter
+        assert 'Data Engineer position at Acme' in letter
+
+
+def _add_applications(session_factory, *rows):
+    with session_factory() as db:
+        for i, row in enumerate(rows):
+            db.add(database.JobApplication(job_id=str(i), job_url=f'https://example.com/{i}', **row))
+        db.commit()
+
+
+class TestReporter:
+    """Test suite for report generation"""
+    
+    def _weekly_row(self, tmp_path) -> dict:
+        generator = reporter.ReportGenerator()
+        output_path = generator.generate_weekly_report(str(tmp_path / 'weekly_report.xlsx'))
+        generator.close()
+        header, row = load_workbook(output_path).active.values
+        return dict(zip(header, row))
+    
+    def test_weekly_report_counts_each_window(self, session_factory, tmp_path):
+        """Test applications count by date applied and responses by date contacted"""
+        now = datetime.utcnow()
+        _add_applications(
+            session_factory,
+            dict(date_applied=now, date_contacted=now, interview_scheduled=True, application_status='interview'),
+            dict(date_applied=now - timedelta(days=10), date_contacted=now, application_status='rejected'),
+            dict(date_applied=now, application_status='sent'),
+            dict(date_applied=now - timedelta(days=30), date_contacted=now - timedelta(days=20), application_status='accepted'),
+        )
+        
+        row = self._weekly_row(tmp_path)
+        assert row['Applications Sent'] == 2
+        assert row['Responses Received'] == 2
+        assert row['Response Rate'] == '100.0%'
+        assert (row['Interviews Scheduled'], row['Rejections'], row['Offers']) == (1, 1, 0)
+    
+    def test_weekly_report_empty_table(self, session_factory, tmp_path):
+        """Test an empty table reports zeros rather than NULL sums"""
+        row = self._weekly_row(tmp_path)
+        assert row['Applications Sent'] == 0
+        assert row['Responses Received'] == 0
+        assert row['Response Rate'] == '0%'
+        assert (row['Interviews Scheduled'], row['Rejections'], row['Offers']) == (0, 0, 0)
+    
+    def test_status_summary_groups_by_status(self, session_factory):
+        """Test status counts and response rate from the GROUP BY"""
+        _add_applications(
+            session_factory,
+            *[dict(application_status=status) for status in ('sent', 'sent', 'pending', 'rejected', 'interview')]
+        )
+        
+        generator = reporter.ReportGenerator()
+        summary = generator.generate_status_summary()
+        generator.close()
+        
+        assert summary == {
+            'Total Applications': 5,
+            'Sent': 2,
+            'Pending Response': 1,
+            'Rejected': 1,
+            'Accepted': 0,
+            'Interview Scheduled': 1,
+            'Response Rate': '40.0%'
+        }
+    
+    def test_status_summary_empty_table(self, session_factory):
+        """Test an empty table summarizes to zeros"""
+        generator = reporter.ReportGenerator()
+        summary = generator.generate_status_summary()
+        generator.close()
+        
+        assert summary['Total Applications'] == 0
+        assert summary['Response Rate'] == '0%'
+
+
+class TestContactFinder:
+    """Test suite for contact finder"""
     
     def test_email_extraction(self):
         """Test email extraction"""
         emails = ContactFinder._extract_emails("Email: test@example.com")
-        self.assertIn('test@example.com', emails)
+        assert 'test@example.com' in emails
+    
+    def test_email_extraction_skips_noreply(self):
+        """Test no-reply addresses are filtered out"""
+        emails = ContactFinder._extract_emails("NoReply@example.com jobs@example.com")
+        assert emails == ['jobs@example.com']
+    
+    def test_email_extraction_keeps_page_order(self):
+        """Test the first address on the page comes first"""
+        text = "jobs@acme.fr, hr@acme.fr, jobs@acme.fr, info@acme.fr"
+        emails = ContactFinder._extract_emails(text)
+        assert emails == ['jobs@acme.fr', 'hr@acme.fr', 'info@acme.fr']
+    
+    def test_website_fetched_as_given(self):
+        """Test the cache key is normalized but the caller's URL is fetched"""
+        finder = ContactFinder()
+        with patch.object(finder.session, 'get') as mock_get:
+            mock_get.return_value.text = '<a href="mailto:jobs@acme.example">Mail</a>'
+            finder._scrape_company_website('https://Acme.example/careers.php?lang=fr#top')
+            finder._scrape_company_website('https://acme.example/careers.php?lang=fr')
+            finder._scrape_company_website('https://acme.example/careers.php?lang=en')
+        
+        fetched = [call.args[0] for call in mock_get.call_args_list]
+        assert fetched == [
+            'https://Acme.example/careers.php?lang=fr#top',
+            'https://acme.example/careers.php?lang=en'
+        ]
+    
+    def test_contact_info_ignores_scripts(self):
+        """Test scripts and attribute values are not read as contact details"""
+        finder = ContactFinder()
+        with patch.object(finder.session, 'get') as mock_get:
+            mock_get.return_value.text = (
+                '<script>var ts = 1700000000123;</script><div data-x="0612345678"></div>'
+                '<img src="/logo@2x.png"><a href="mailto:jobs@acme.example">Mail</a> <a href="/contact">Contact</a>'
+            )
+            info = finder._scrape_company_website('https://acme.example/')
+        
+        assert info['phone'] is None
+        assert info['email'] == 'jobs@acme.example'
+        assert info['contact_page_url'] == 'https://acme.example/contact'
     
     def test_french_phone_extraction(self):
         """Test French phone number extraction"""
         text = "Tel: +33 1 23 45 67 89"
         phones = ContactFinder._extract_phone_numbers(text)
-        self.assertTrue(len(phones) > 0)
-
-
-if __name__ == '__main__':
-    unittest.main()
+        assert len(phones) > 0